@@ -17,9 +17,10 @@ class SingletonStore(Generic[_T]):
 
     def load(self, cls: type[_T]) -> _T:
         """Retrieve a singleton for the given class or create a new one."""
-        if cls not in self._instances_by_class:
-            self.push(cls())
-        return self._instances_by_class[cls]
+        if (instance := self._instances_by_class.get(cls)) is None:
+            instance = cls()
+            self.push(instance)
+        return instance
 
     def push(self, instance: _T) -> None:
         """Set or replace a singleton instance in the store."""
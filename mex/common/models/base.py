@@ -68,16 +68,17 @@ class BaseModel(PydanticBaseModel):
     @classmethod
     @cache
     def _get_alias_lookup(cls) -> dict[str, str]:
-        """Build a cached mapping from field alias to field names."""
-        return {
-            field_info.alias or field_name: field_name
-            for field_name, field_info in cls.model_fields.items()
-        }
+        """Build a cached mapping from field aliases and names to field names."""
+        lookup = {field_name: field_name for field_name in cls.model_fields}
+        for field_name, field_info in cls.model_fields.items():
+            if field_info.alias:
+                lookup[field_info.alias] = field_name
+        return lookup
 
     @classmethod
     @cache
-    def _get_list_field_names(cls) -> list[str]:
-        """Build a cached list of fields that look like lists."""
+    def _get_list_field_names(cls) -> frozenset[str]:
+        """Build a cached set of fields that look like lists."""
         field_names = []
         for field_name, field_info in cls.model_fields.items():
             field_types = get_inner_types(
@@ -88,12 +89,12 @@ class BaseModel(PydanticBaseModel):
                 for field_type in field_types
             ):
                 field_names.append(field_name)
-        return field_names
+        return frozenset(field_names)
 
     @classmethod
     @cache
-    def _get_field_names_allowing_none(cls) -> list[str]:
-        """Build a cached list of fields can be set to None."""
+    def _get_field_names_allowing_none(cls) -> frozenset[str]:
+        """Build a cached set of fields can be set to None."""
         field_names: list[str] = []
         for field_name, field_info in cls.model_fields.items():
             validator = TypeAdapter(field_info.annotation)
@@ -102,7 +103,7 @@ class BaseModel(PydanticBaseModel):
             except ValidationError:
                 continue
             field_names.append(field_name)
-        return field_names
+        return frozenset(field_names)
 
     @classmethod
     def _convert_non_list_to_list(cls, field_name: str, value: Any) -> list[Any] | None:
@@ -140,6 +141,19 @@ class BaseModel(PydanticBaseModel):
         # already desired shape
         return value
 
+    @classmethod
+    def _fix_listyness(cls, data: RawModelDataT) -> RawModelDataT:
+        """Fix the list shapes of all modelled keys in a mapping of raw data."""
+        if isinstance(data, MutableMapping):
+            # iterate over the known fields instead of the raw data, because
+            # payloads like wikidata responses can have many unmodelled keys
+            for name, field_name in cls._get_alias_lookup().items():
+                if name in data:
+                    data[name] = cls._fix_value_listyness_for_field(
+                        field_name, data[name]
+                    )
+        return data
+
     @model_validator(mode="before")
     @classmethod
     def fix_listyness(cls, data: RawModelDataT) -> RawModelDataT:
@@ -161,12 +175,7 @@ class BaseModel(PydanticBaseModel):
         Returns:
             data with fixed list shapes
         """
-        if isinstance(data, MutableMapping):
-            for name, value in data.items():
-                field_name = cls._get_alias_lookup().get(name, name)
-                if field_name in cls.model_fields:
-                    data[name] = cls._fix_value_listyness_for_field(field_name, value)
-        return data
+        return cls._fix_listyness(data)
 
     def checksum(self) -> str:
         """Calculate md5 checksum for this model."""
@@ -1,48 +1,96 @@
 import json
 from collections.abc import Generator, Iterable
+from enum import Enum
+from itertools import chain
+from sys import intern
+from typing import Any, TypeVar
+
+from pydantic import BaseModel as PydanticBaseModel
+from pydantic import TypeAdapter
 
 from mex.common.logging import watch
-from mex.common.models import ExtractedOrganizationalUnit
+from mex.common.models import BaseModel, ExtractedOrganizationalUnit
 from mex.common.organigram.models import OrganigramUnit
 from mex.common.settings import BaseSettings
 from mex.common.types import MergedOrganizationalUnitIdentifier
+from mex.common.utils import get_inner_types
 
+ModelT = TypeVar("ModelT", bound=PydanticBaseModel)
 
-@watch
-def extract_organigram_units() -> Generator[OrganigramUnit, None, None]:
-    """Extract organizational units from the organigram JSON file.
+ORGANIGRAM_UNITS_ADAPTER = TypeAdapter(list[OrganigramUnit])
 
-    Settings:
-        organigram_path: Resolved path to the organigram file
+
+def _construct_without_validation(model: type[ModelT], raw: dict[str, Any]) -> ModelT:
+    """Recursively construct a model and its nested models without validation.
+
+    Only use this for trusted input, because no validators or type coercions are
+    applied. Only the list shapes of MEx models are fixed and enum values are
+    converted for models that do not use raw enum values.
+
+    Args:
+        model: Model class to construct
+        raw: Raw data with field names as keys
 
     Returns:
-        Generator for organigram units
+        Instance of the given model class
     """
-    settings = BaseSettings.get()
-    with open(settings.organigram_path) as fh:
-        for raw in json.load(fh):
-            yield OrganigramUnit.model_validate(raw)
+    if issubclass(model, BaseModel):
+        raw = model._fix_listyness(dict(raw))
+    convert_enums = not model.model_config.get("use_enum_values")
+    values: dict[str, Any] = {}
+    for field_name, value in raw.items():
+        if (field_info := model.model_fields.get(field_name)) is None:
+            continue
+        for inner_type in get_inner_types(field_info.annotation):
+            if not isinstance(inner_type, type):
+                continue
+            if issubclass(inner_type, PydanticBaseModel):
+                if isinstance(value, list):
+                    value = [
+                        (
+                            _construct_without_validation(inner_type, item)
+                            if isinstance(item, dict)
+                            else item
+                        )
+                        for item in value
+                    ]
+                elif isinstance(value, dict):
+                    value = _construct_without_validation(inner_type, value)
+                break
+            if convert_enums and issubclass(inner_type, Enum):
+                if isinstance(value, list):
+                    value = [inner_type(item) for item in value]
+                elif value is not None:
+                    value = inner_type(value)
+                break
+        values[field_name] = value
+    return model.model_construct(**values)
 
 
-def _get_synonyms(
-    extracted_unit: ExtractedOrganizationalUnit,
-) -> Generator[str, None, None]:
-    """Generate synonyms for a unit using its name fields.
+@watch
+def extract_organigram_units(
+    validate: bool = True,
+) -> Generator[OrganigramUnit, None, None]:
+    """Extract organizational units from the organigram JSON file.
 
     Args:
-        extracted_unit: Extracted organizational unit
+        validate: Whether to validate the units, set to False to skip validation
+            for trusted files that are already in the shape of `OrganigramUnit`
+
+    Settings:
+        organigram_path: Resolved path to the organigram file
 
     Returns:
-        Generator with (possibly duplicate) synonyms
+        Generator for organigram units
     """
-    yield extracted_unit.identifierInPrimarySource
-    for names in [
-        extracted_unit.name,
-        extracted_unit.shortName,
-        extracted_unit.alternativeName,
-    ]:
-        for name in names:
-            yield name.value
+    settings = BaseSettings.get()
+    with open(settings.organigram_path, "rb") as fh:
+        content = fh.read()
+    if validate:
+        yield from ORGANIGRAM_UNITS_ADAPTER.validate_json(content)
+    else:
+        for raw in json.loads(content):
+            yield _construct_without_validation(OrganigramUnit, raw)
 
 
 def get_unit_merged_ids_by_synonyms(
@@ -51,6 +99,7 @@ def get_unit_merged_ids_by_synonyms(
     """Return a mapping from unit alt_label and label to their merged IDs.
 
     There will be multiple entries per unit mapping to the same merged ID.
+    The synonyms are interned, because they are mostly used as lookup keys.
 
     Args:
         extracted_units: Iterable of extracted units
@@ -58,11 +107,18 @@ def get_unit_merged_ids_by_synonyms(
     Returns:
         Mapping from unit synonyms to stableTargetIds
     """
-    return {
-        synonym: MergedOrganizationalUnitIdentifier(extracted_unit.stableTargetId)
-        for extracted_unit in extracted_units
-        for synonym in _get_synonyms(extracted_unit)
-    }
+    merged_ids_by_synonyms: dict[str, MergedOrganizationalUnitIdentifier] = {}
+    for extracted_unit in extracted_units:
+        merged_id = MergedOrganizationalUnitIdentifier(extracted_unit.stableTargetId)
+        identifier = intern(extracted_unit.identifierInPrimarySource)
+        merged_ids_by_synonyms[identifier] = merged_id
+        for name in chain(
+            extracted_unit.name,
+            extracted_unit.shortName,
+            extracted_unit.alternativeName,
+        ):
+            merged_ids_by_synonyms[intern(name.value)] = merged_id
+    return merged_ids_by_synonyms
 
 
 def get_unit_merged_ids_by_emails(
@@ -78,8 +134,9 @@ def get_unit_merged_ids_by_emails(
     Returns:
         Mapping from lowercased `email` to stableTargetIds
     """
-    return {
-        email.lower(): MergedOrganizationalUnitIdentifier(extracted_unit.stableTargetId)
-        for extracted_unit in extracted_units
-        for email in extracted_unit.email
-    }
+    merged_ids_by_emails: dict[str, MergedOrganizationalUnitIdentifier] = {}
+    for extracted_unit in extracted_units:
+        merged_id = MergedOrganizationalUnitIdentifier(extracted_unit.stableTargetId)
+        for email in extracted_unit.email:
+            merged_ids_by_emails[email.lower()] = merged_id
+    return merged_ids_by_emails
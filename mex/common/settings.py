@@ -1,5 +1,7 @@
+from functools import cache
 from pathlib import Path
-from typing import Any, Self, cast
+from types import UnionType
+from typing import Any, Self, Union, cast
 
 from pydantic import AnyUrl, Field, SecretStr, model_validator
 from pydantic_core import Url
@@ -8,7 +10,8 @@ from pydantic_settings import SettingsConfigDict
 from pydantic_settings.sources import ENV_FILE_SENTINEL, DotenvType, EnvSettingsSource
 
 from mex.common.context import SingletonStore
-from mex.common.types import AssetsPath, IdentityProvider, Sink, WorkPath
+from mex.common.types import AssetsPath, IdentityProvider, PathWrapper, Sink, WorkPath
+from mex.common.utils import get_inner_types
 
 SETTINGS_STORE = SingletonStore["BaseSettings"]()
 
@@ -179,21 +182,27 @@ class BaseSettings(PydanticBaseSettings):
         validation_alias="MEX_WIKI_QUERY_SERVICE_URL",
     )
 
+    @classmethod
+    @cache
+    def _get_text_indent(cls) -> int:
+        """Get the cached width of the key column for rendering settings as text."""
+        return max(len(name) for name in cls.model_fields)
+
     def text(self) -> str:
         """Dump the current settings into a readable table."""
-        dict_ = self.model_dump()
-        indent = max(len(key) for key in dict_)
+        indent = self._get_text_indent()
         return "\n".join(
             [
-                f"{key.ljust(indent)} "
+                f"{key:<{indent}} "
                 f"{', '.join(str(v) for v in val) if isinstance(val, list) else val}"
-                for key, val in dict_.items()
+                for key, val in self.model_dump().items()
             ]
         )
 
     @classmethod
+    @cache
     def get_env_name(cls, name: str) -> str:
-        """Get the name of the environment variable for field with given name."""
+        """Get the cached environment variable name for the field with given name."""
         field = cls.model_fields[name]
         env_settings = EnvSettingsSource(
             cls,
@@ -203,10 +212,25 @@ class BaseSettings(PydanticBaseSettings):
         env_info = env_settings._extract_field_info(field, name)
         return env_info[0][1].upper()
 
+    @classmethod
+    @cache
+    def _get_path_field_names(cls) -> frozenset[str]:
+        """Build a cached set of fields that can hold an AssetsPath or WorkPath."""
+        return frozenset(
+            field_name
+            for field_name, field_info in cls.model_fields.items()
+            if any(
+                isinstance(field_type, type) and issubclass(field_type, PathWrapper)
+                for field_type in get_inner_types(
+                    field_info.annotation, unpack=(Union, UnionType)
+                )
+            )
+        )
+
     @model_validator(mode="after")
     def resolve_paths(self) -> Self:
         """Resolve AssetPath and WorkPath."""
-        for name in self.model_fields:
+        for name in self._get_path_field_names():
             value = getattr(self, name)
             if isinstance(value, AssetsPath) and value.is_relative():
                 setattr(self, name, self.assets_dir.resolve() / value)
@@ -37,15 +37,19 @@ except ImportError:
     pytest = NoOpPytest  # type: ignore[assignment]
 
 
-@pytest.fixture(autouse=True)
-def patch_reprs(monkeypatch: pytest.MonkeyPatch) -> None:
+@pytest.fixture(autouse=True, scope="session")
+def patch_reprs() -> Generator[None, None, None]:
     """Allow for easier copying of expected output by patching __repr__ methods."""
-    monkeypatch.setattr(
-        Enum, "__repr__", lambda self: f"{self.__class__.__name__}.{self.name}"
-    )
-    monkeypatch.setattr(
-        AnyUrl, "__repr__", lambda self: f'AnyUrl("{self}", scheme="{self.scheme}")'
-    )
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(
+            Enum, "__repr__", lambda self: f"{self.__class__.__name__}.{self.name}"
+        )
+        monkeypatch.setattr(
+            AnyUrl,
+            "__repr__",
+            lambda self: f'AnyUrl("{self}", scheme="{self.scheme}")',
+        )
+        yield
 
 
 @pytest.fixture(autouse=True)
@@ -86,7 +90,7 @@ def isolate_connectors() -> Generator[None, None, None]:
 @pytest.fixture()
 def is_integration_test(request: pytest.FixtureRequest) -> bool:
     """Check the markers of a test to see if this is an integration test."""
-    return any(m.name == "integration" for m in request.keywords.get("pytestmark", ()))
+    return request.node.get_closest_marker("integration") is not None
 
 
 @pytest.fixture()
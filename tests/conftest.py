@@ -12,7 +12,7 @@ from mex.common.types import (
     MergedPrimarySourceIdentifier,
 )
 
-pytest_plugins = ("mex.common.testing.plugin",)
+pytest_plugins = ("mex.common.testing.plugin", "pytester")
 
 
 @pytest.fixture
@@ -18,17 +18,17 @@ class ComplexDummyModel(BaseModel):
 
 
 def test_get_field_names_allowing_none() -> None:
-    assert ComplexDummyModel._get_field_names_allowing_none() == [
+    assert ComplexDummyModel._get_field_names_allowing_none() == {
         "optional_str",
         "optional_list",
-    ]
+    }
 
 
 def test_get_list_field_names() -> None:
-    assert ComplexDummyModel._get_list_field_names() == [
+    assert ComplexDummyModel._get_list_field_names() == {
         "optional_list",
         "required_list",
-    ]
+    }
 
 
 class Animal(Enum):
@@ -90,6 +90,17 @@ def test_base_model_listyness_fix_only_runs_on_mutable_mapping() -> None:
         Shelter(inhabitants="foo")  # type: ignore
 
 
+def test_base_model_listyness_fix_uses_aliases_and_names() -> None:
+    class Organization(BaseModel):
+        websites: Annotated[list[str], Field(alias="P856")] = []
+
+    by_alias = Organization.model_validate({"P856": "https://a", "P1": "ignored"})
+    by_name = Organization.model_validate({"websites": "https://b"})
+
+    assert by_alias.websites == ["https://a"]
+    assert by_name.websites == ["https://b"]
+
+
 class DummyBaseModel(BaseModel):
     foo: str | None = None
 
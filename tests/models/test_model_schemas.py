@@ -1,9 +1,8 @@
 import json
 import re
-from collections.abc import Callable
-from copy import deepcopy
+from collections.abc import Callable, Hashable
+from functools import cache
 from importlib.resources import files
-from itertools import zip_longest
 from typing import Any
 
 import pytest
@@ -14,15 +13,8 @@ from mex.common.types.identifier import MEX_ID_PATTERN
 
 MEX_MODEL_ENTITIES = files("mex.model.entities")
 
-GENERATED_SCHEMAS = dict(
-    sorted(
-        {
-            name.removeprefix("Extracted"): model.model_json_schema(
-                ref_template="/schema/fields/{model}"
-            )
-            for name, model in EXTRACTED_MODEL_CLASSES_BY_NAME.items()
-        }.items()
-    )
+GENERATED_ENTITY_TYPES = sorted(
+    name.removeprefix("Extracted") for name in EXTRACTED_MODEL_CLASSES_BY_NAME
 )
 SPECIFIED_SCHEMAS = dict(
     sorted(
@@ -34,6 +26,14 @@ SPECIFIED_SCHEMAS = dict(
         }.items()
     )
 )
+TEXT_PATTERN = re.compile(r"[a-zA-Z_-]+")
+# annotations that we can safely ignore when comparing field definitions
+# (these have no use-case and no implementation plans yet)
+IGNORED_ANNOTATIONS = (
+    "sameAs",  # only in spec
+    "subPropertyOf",  # only in spec
+    "description",  # only in model (mostly implementation hints)
+)
 ENTITY_TYPES_AND_FIELD_NAMES_BY_FQN = {
     f"{entity_type}.{field_name}": (entity_type, field_name)
     for entity_type, schema in SPECIFIED_SCHEMAS.items()
@@ -41,52 +41,64 @@ ENTITY_TYPES_AND_FIELD_NAMES_BY_FQN = {
 }
 
 
+@cache
+def get_generated_schema(entity_type: str) -> dict[str, Any]:
+    # generate schemas lazily, so only the ones that are needed get built
+    model = EXTRACTED_MODEL_CLASSES_BY_NAME[f"Extracted{entity_type}"]
+    return model.model_json_schema(ref_template="/schema/fields/{model}")
+
+
 def test_entity_types_match_spec() -> None:
-    assert list(GENERATED_SCHEMAS) == list(SPECIFIED_SCHEMAS)
+    assert GENERATED_ENTITY_TYPES == list(SPECIFIED_SCHEMAS)
 
 
-@pytest.mark.parametrize(
-    ("generated", "specified"),
-    zip_longest(GENERATED_SCHEMAS.values(), SPECIFIED_SCHEMAS.values()),
-    ids=GENERATED_SCHEMAS,
-)
-def test_field_names_match_spec(
-    generated: dict[str, Any], specified: dict[str, Any]
-) -> None:
+@pytest.mark.parametrize("entity_type", GENERATED_ENTITY_TYPES)
+def test_field_names_match_spec(entity_type: str) -> None:
+    assert entity_type in SPECIFIED_SCHEMAS, f"{entity_type} is not specified"
     generated = {
-        k: v for k, v in generated["properties"].items() if k != "$type"
+        k: v
+        for k, v in get_generated_schema(entity_type)["properties"].items()
+        if k != "$type"
     }  # only in generated models
+    specified = SPECIFIED_SCHEMAS[entity_type]
     assert set(generated) == set(specified["properties"])
 
 
-@pytest.mark.parametrize(
-    ("generated", "specified"),
-    zip_longest(GENERATED_SCHEMAS.values(), SPECIFIED_SCHEMAS.values()),
-    ids=GENERATED_SCHEMAS,
-)
-def test_entity_type_matches_class_name(
-    generated: dict[str, Any], specified: dict[str, Any]
-) -> None:
+@pytest.mark.parametrize("entity_type", GENERATED_ENTITY_TYPES)
+def test_entity_type_matches_class_name(entity_type: str) -> None:
+    assert entity_type in SPECIFIED_SCHEMAS, f"{entity_type} is not specified"
+    generated = get_generated_schema(entity_type)
+    specified = SPECIFIED_SCHEMAS[entity_type]
     assert generated["title"] == generated["properties"]["$type"]["const"]
     assert (
         specified["title"].replace(" ", "") in generated["properties"]["$type"]["const"]
     )
 
 
-@pytest.mark.parametrize(
-    ("generated", "specified"),
-    zip_longest(GENERATED_SCHEMAS.values(), SPECIFIED_SCHEMAS.values()),
-    ids=GENERATED_SCHEMAS,
-)
-def test_required_fields_match_spec(
-    generated: dict[str, Any], specified: dict[str, Any]
-) -> None:
+@pytest.mark.parametrize("entity_type", GENERATED_ENTITY_TYPES)
+def test_required_fields_match_spec(entity_type: str) -> None:
+    assert entity_type in SPECIFIED_SCHEMAS, f"{entity_type} is not specified"
+    generated = get_generated_schema(entity_type)
+    specified = SPECIFIED_SCHEMAS[entity_type]
     assert set(generated["required"]) == set(specified["required"])
 
 
+def freeze(obj: Any) -> Hashable:
+    # convert json-like data into an equivalent hashable form
+    if isinstance(obj, dict):
+        return frozenset((key, freeze(value)) for key, value in obj.items())
+    if isinstance(obj, list):
+        return tuple(freeze(item) for item in obj)
+    # include the type, so that e.g. `True`, `1` and `1.0` stay distinct
+    return type(obj), obj
+
+
 def deduplicate_dicts(dct: dict[str, Any], key: str) -> None:
-    # take a set of dicts and deduplicate them by dumping/loading to json
-    dct[key] = [json.loads(s) for s in dict.fromkeys(json.dumps(d) for d in dct[key])]
+    # take a list of dicts and deduplicate them by their frozen form
+    unique: dict[Hashable, Any] = {}
+    for item in dct[key]:
+        unique.setdefault(freeze(item), item)
+    dct[key] = list(unique.values())
 
 
 def dissolve_single_item_lists(dct: dict[str, Any], key: str) -> None:
@@ -95,9 +107,10 @@ def dissolve_single_item_lists(dct: dict[str, Any], key: str) -> None:
         dct.update(dct.pop(key)[0])
 
 
+@cache
 def sub_only_text(repl: Callable[[str], str], string: str) -> str:
     # substitute only the textual parts of a string, e.g. leave slashes alone
-    return re.sub(r"([a-zA-Z_-]+)", lambda m: repl(m.group(0)), string)
+    return TEXT_PATTERN.sub(lambda m: repl(m.group(0)), string)
 
 
 def prepare_field(field: str, obj: list[Any] | dict[str, Any]) -> None:
@@ -109,10 +122,8 @@ def prepare_field(field: str, obj: list[Any] | dict[str, Any]) -> None:
         return
 
     # discard annotations that we can safely ignore
-    # (these have no use-case and no implementation plans yet)
-    obj.pop("sameAs", None)  # only in spec
-    obj.pop("subPropertyOf", None)  # only in spec
-    obj.pop("description", None)  # only in model (mostly implementation hints)
+    for key in IGNORED_ANNOTATIONS:
+        obj.pop(key, None)
 
     # pop annotations that we don't compare directly but use for other comparisons
     title = obj.pop("title", "")  # only in model (autogenerated by pydantic)
@@ -134,21 +145,23 @@ def prepare_field(field: str, obj: list[Any] | dict[str, Any]) -> None:
                 .removeprefix("Extracted")
             )
 
-    # align concept/enum annotations
-    # (spec uses `useScheme` to specify vocabularies and models use enums)
-    if obj.get("$ref") == "/schema/entities/concept#/identifier":
-        obj["$ref"] = f"/schema/fields/{vocabulary}"
+    if (ref := obj.get("$ref")) is not None:
+        # align concept/enum annotations
+        # (spec uses `useScheme` to specify vocabularies and models use enums)
+        if ref == "/schema/entities/concept#/identifier":
+            ref = f"/schema/fields/{vocabulary}"
 
-    # make sure all refs have paths in kebab-case
-    # (the models use the class names, whereas the spec uses kebab-case URLs)
-    if "$ref" in obj:
-        obj["$ref"] = sub_only_text(dromedary_to_kebab, obj["$ref"])
+        # make sure all refs have paths in kebab-case
+        # (the models use the class names, whereas the spec uses kebab-case URLs)
+        obj["$ref"] = sub_only_text(dromedary_to_kebab, ref)
 
     # recurse into the field definitions for array items
     if obj.get("type") == "array":
         prepare_field(field, obj["items"])
 
-    for quantifier in {"anyOf", "allOf"} & set(obj):
+    for quantifier in ("anyOf", "allOf"):
+        if quantifier not in obj:
+            continue
         # prepare choices
         prepare_field(field, obj[quantifier])
         # deduplicate items, used for date/times
@@ -163,10 +176,13 @@ def prepare_field(field: str, obj: list[Any] | dict[str, Any]) -> None:
     ids=ENTITY_TYPES_AND_FIELD_NAMES_BY_FQN.keys(),
 )
 def test_field_defs_match_spec(entity_type: str, field_name: str) -> None:
+    assert entity_type in GENERATED_ENTITY_TYPES, f"{entity_type} is not generated"
     specified_properties = SPECIFIED_SCHEMAS[entity_type]["properties"]
-    generated_properties = GENERATED_SCHEMAS[entity_type]["properties"]
-    specified = deepcopy(specified_properties[field_name])
-    generated = deepcopy(generated_properties[field_name])
+    generated_properties = get_generated_schema(entity_type)["properties"]
+    # copy the field definitions by round-tripping them through json,
+    # because that is much faster than `deepcopy` for json-shaped data
+    specified = json.loads(json.dumps(specified_properties[field_name]))
+    generated = json.loads(json.dumps(generated_properties[field_name]))
 
     prepare_field(field_name, specified)
     prepare_field(field_name, generated)
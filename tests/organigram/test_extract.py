@@ -1,3 +1,6 @@
+import json
+from pathlib import Path
+
 from mex.common.models import ExtractedOrganizationalUnit
 from mex.common.organigram.extract import (
     extract_organigram_units,
@@ -5,6 +8,8 @@ from mex.common.organigram.extract import (
     get_unit_merged_ids_by_synonyms,
 )
 from mex.common.organigram.models import OrganigramUnit
+from mex.common.settings import BaseSettings
+from mex.common.types import AssetsPath, Link, Text, TextLanguage
 
 
 def test_extract_organigram_units(
@@ -14,6 +19,39 @@ def test_extract_organigram_units(
     assert units == [child_unit, parent_unit]
 
 
+def test_extract_organigram_units_without_validation(
+    tmp_path: Path, settings: BaseSettings
+) -> None:
+    organigram_path = tmp_path / "organizational_units.json"
+    organigram_path.write_text(
+        json.dumps(
+            [
+                {
+                    "identifier": "trusted-unit",
+                    "name": [{"value": "Trusted Unit", "language": "en"}],
+                    "shortName": [{"value": "TU", "language": None}],
+                    "website": [{"url": "https://trusted.example"}],
+                }
+            ]
+        )
+    )
+    settings.organigram_path = AssetsPath(organigram_path)
+
+    units = list(extract_organigram_units(validate=False))
+
+    assert units == [
+        OrganigramUnit(
+            identifier="trusted-unit",
+            name=[Text(value="Trusted Unit", language=TextLanguage.EN)],
+            shortName=[Text(value="TU", language=None)],
+            website=Link(url="https://trusted.example"),
+        )
+    ]
+    assert isinstance(units[0].name[0], Text)
+    assert units[0].name[0].language is TextLanguage.EN
+    assert isinstance(units[0].website, Link)
+
+
 def test_get_unit_merged_ids_by_synonyms(
     extracted_child_unit: ExtractedOrganizationalUnit,
     extracted_parent_unit: ExtractedOrganizationalUnit,
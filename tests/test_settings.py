@@ -51,6 +51,12 @@ def test_settings_getting_caches_singleton() -> None:
     assert settings_fetched_again is settings
 
 
+def test_get_env_name() -> None:
+    assert FooSettings.get_env_name("foo") == "MEX_FOO"
+    assert FooSettings.get_env_name("debug") == "MEX_DEBUG"
+    assert BarSettings.get_env_name("bar") == "MEX_BAR"
+
+
 @pytest.mark.integration
 def test_parse_env_file() -> None:
     settings = BaseSettings.get()
@@ -0,0 +1,41 @@
+import pytest
+
+
+def test_is_integration_test(pytester: pytest.Pytester) -> None:
+    pytester.makeconftest('pytest_plugins = ("mex.common.testing.plugin",)')
+    pytester.makepyfile(
+        test_function_marks="""
+            import pytest
+
+            @pytest.mark.integration
+            def test_marked(is_integration_test: bool) -> None:
+                assert is_integration_test is True
+
+            def test_unmarked(is_integration_test: bool) -> None:
+                assert is_integration_test is False
+        """,
+        test_class_marks="""
+            import pytest
+
+            @pytest.mark.integration
+            class TestMarked:
+                def test_marked(self, is_integration_test: bool) -> None:
+                    assert is_integration_test is True
+
+            class TestUnmarked:
+                def test_unmarked(self, is_integration_test: bool) -> None:
+                    assert is_integration_test is False
+        """,
+        test_module_marks="""
+            import pytest
+
+            pytestmark = pytest.mark.integration
+
+            def test_marked(is_integration_test: bool) -> None:
+                assert is_integration_test is True
+        """,
+    )
+
+    result = pytester.runpytest("-p", "no:cacheprovider")
+
+    result.assert_outcomes(passed=5)